@@ -1,2 +1,3 @@
 from cattreelib.category import Category
 from cattreelib.path import Path
+from cattreelib.frozen import FrozenCategoryTree
@@ -16,8 +16,10 @@
 red    yellow   green     muscat shiraz  merlot         red   green   yellow              red    green
 """
 
+import sys
 from collections.abc import Iterable
 from cattreelib.path import Path
+from cattreelib.frozen import FrozenCategoryTree
 from cattreelib.error import (
     ParentLoopError,
     NotACategoryError,
@@ -60,11 +62,46 @@ class Category:
         A parent can't be a child of any of its children.
 
     """
+    __slots__ = (
+        '_parent',
+        '_children',
+        '_path_cache',
+        '_ancestor_names',
+        '_root',
+        '_name_index',
+        '_get_cache',
+        '_depth',
+        '_by_depth',
+        '_leaves_cache',
+        '_name',
+        'description',
+        'image',
+        '__weakref__',
+    )
+
+    # Categories are compared by name, which can change, so they can't be hashed
+    __hash__ = None
+
     def __init__(self, name=None, description=None, image=None, parent=None, children=None):
         self._parent = None
-        self._children = []
-
-        self.name = name
+        # Children by name, in insertion order
+        self._children = {}
+        self._path_cache = None
+        self._ancestor_names = None
+        # Root and depth are resolved on first use, see _resolve_root()
+        self._root = None
+
+        # Names are interned, so comparing them to (interned) path nodes is mostly an identity check
+        self._name = sys.intern(name) if type(name) is str else name
+        # Only the root of a tree keeps a name index (name -> categories with that name), built on first use
+        self._name_index = None
+        # Only the root keeps a lookup cache (path -> found category), built on first use and dropped on every change
+        self._get_cache = None
+        self._depth = None
+        # Only the root keeps the categories grouped by depth, built on first use and dropped on every change
+        self._by_depth = None
+        # Leaves of the subtree, built on first use and dropped when a category is added or removed below
+        self._leaves_cache = None
         self.description = description
         self.image = image
         self.parent = parent
@@ -79,14 +116,128 @@ class Category:
     def __repr__(self):
         return f"<Category: {self.name}>"
 
+    @property
+    def name(self):
+        """
+        Return the name of the category
+        """
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """
+        Set the name of the current category.
+
+        Keeps the children of the parent, the name index of the tree and the caches depending on the name in sync.
+        A sibling with the same name is rejected here, as the category would take its place among the children.
+        The rule about ancestors with the same name is checked by update(), not here.
+
+        Parameters:
+        name(str): the new name of the current category
+
+        Returns:
+        None
+
+        Raises:
+        DuplicateNameError
+        """
+        if type(name) is str:
+            name = sys.intern(name)
+
+        parent = self._parent
+        # A parent can be assigned without adding the category to its children, see the parent setter
+        in_tree = parent is None or parent._children.get(self._name) is self
+
+        if in_tree and parent is not None:
+            sibling = parent._children.get(name)
+            if sibling is not None and sibling is not self:
+                raise DuplicateNameError(name, parent)
+
+        if in_tree:
+            self._unindex(self.root, subtree=False)
+            if parent:
+                # Rebuilt rather than re-inserted so the category keeps its position among its siblings
+                parent._children = {
+                    (name if category is self else category_name): category
+                    for category_name, category in parent._children.items()
+                }
+
+        self._name = name
+
+        if in_tree:
+            self._index(self.root, subtree=False)
+            self.root._get_cache = None
+        self._invalidate_path()
+
     @property
     def path(self):
         """
         Return the path from the root to the current category including the current one.
+
+        The path is cached and the cache is invalidated whenever the category (or one of its ancestors)
+        is attached to a new parent, detached or renamed. Paths can be changed with add(), so every read
+        returns a new Path sharing the cached nodes and string.
         """
-        if not self.parent:
-            return Path([self.name])
-        return Path(self.parent.path) + Path([self.name])
+        if self._path_cache is None:
+            # Walk up to the root, or to the first ancestor whose path is already known
+            names = []
+            prefix = ()
+            category = self
+            while category is not None:
+                if category._path_cache is not None:
+                    prefix = category._path_cache.nodes
+                    break
+                names.append(category.name)
+                category = category._parent
+            names.reverse()
+            # A category with a cached path always knows its root, see _invalidate_path()
+            if self._root is None:
+                self._resolve_root()
+            self._path_cache = Path._unchecked(prefix + tuple(names))
+        return Path._unchecked(self._path_cache.nodes, str(self._path_cache))
+
+    @property
+    def root(self):
+        """
+        Return the root of the tree the category belongs to
+
+        The root is the topmost category reachable through the children of its ancestors. A category whose
+        parent was only assigned (Category(name=..., parent=...)) is not among the children of that parent,
+        so it is the root of its own tree until it is added to them, even though is_root() is False.
+        """
+        if self._root is None:
+            self._resolve_root()
+        return self._root
+
+    @property
+    def depth(self):
+        """
+        Return the depth of the category within its tree (0 for the root)
+        """
+        if self._root is None:
+            self._resolve_root()
+        return self._depth
+
+    @property
+    def ancestor_names(self):
+        """
+        Return the names of all the ancestors of the category.
+
+        The set is cached and invalidated together with the path.
+        """
+        if self._ancestor_names is None:
+            # Walk up to the root, or to the first ancestor whose set is already known
+            uncached = []
+            category = self
+            while category._parent is not None and category._ancestor_names is None:
+                uncached.append(category)
+                category = category._parent
+            names = category._ancestor_names
+            if names is None:
+                names = category._ancestor_names = frozenset()
+            for category in reversed(uncached):
+                names = category._ancestor_names = names | {category._parent.name}
+        return self._ancestor_names
 
     @property
     def parent(self):
@@ -123,19 +274,23 @@ class Category:
             if self.parent:
                 self.parent._remove_child(self)
         self._parent = parent
+        self._invalidate_path()
 
     @property
     def children(self):
         """
         Return a list of the children of the category
         """
-        return self._children
+        return list(self._children.values())
 
     @children.setter
     def children(self, children):
         """
         Set the children of the current category.
 
+        All the children are validated before any of them is attached, so the current children
+        are left untouched if one of the new ones is invalid.
+
         Parameters:
         children (list): iterable of instances of Category
 
@@ -145,24 +300,47 @@ class Category:
         if not isinstance(children, Iterable):
             raise ChildrenNotIterableError()
 
-        self._children = []
+        children = list(children)
+        names = {self.name}
+        ancestor_names = self.ancestor_names
         for child in children:
             if not isinstance(child, Category):
                 raise NotACategoryError(child)
-            self._add_child(child)
+            # Check no ancestors or siblings with the same name
+            if child.name in names or child.name in ancestor_names:
+                raise DuplicateNameError(child.name, self)
+            names.add(child.name)
+
+        for child in list(self._children.values()):
+            self._remove_child(child)
+
+        self._children = {}
+        for child in children:
+            self._attach(child)
 
     @property
     def leaves(self):
         """
         Return all the leaf categories
         """
+        if self._leaves_cache is not None:
+            return list(self._leaves_cache)
+
         leaves = []
-        if not self.children:
-            leaves = [self]
-        else:
-            for child in self.children:
-                leaves.extend(child.leaves)
-        return leaves
+        # Stack of iterators over the children still to visit, so they are visited from left to right
+        # without copying and reversing every children dict
+        stack = [iter((self,))]
+        while stack:
+            for category in stack[-1]:
+                if category._children:
+                    stack.append(iter(category._children.values()))
+                    break
+                leaves.append(category)
+            else:
+                stack.pop()
+
+        self._leaves_cache = leaves
+        return list(leaves)
 
     def get(self, path):
         """
@@ -181,20 +359,24 @@ class Category:
         Invalid searches (return None):
             tree.get('food/apple')
 
+        When searching from the root, the start of the path is looked up in the name index of the tree
+        instead of traversing it, and found categories are cached until the tree changes.
+
         Parameters:
         path(str,iterable,Path): path of the category that is searched for
 
         Returns:
         found(Category,None): the found category or None
         """
-        found = None
-        path = Path(path)
+        # A single name doesn't need a Path when the name index of the tree can answer directly
+        if isinstance(path, str) and path and Path.SEPARATOR not in path and self.root is self:
+            categories = self._get_name_index().get(path)
+            if not categories:
+                return None
+            if len(categories) == 1:
+                return categories[0]
 
-        start = self._find_start(path)
-        if start:
-            found = start._find(path)
-
-        return found
+        return self._descend(Path.of(path))
 
     def add(self, category, path=None):
         """
@@ -210,8 +392,8 @@ class Category:
         if not path:
             self._add_child(category)
         else:
-            path = Path(path)
-            parent = self.get(path)
+            path = Path.of(path)
+            parent = self._descend(path)
             if not parent:
                 raise CategoryDoesNotExistError(path)
             parent._add_child(category)
@@ -232,8 +414,11 @@ class Category:
 
         Raises:
         RootDeleteError
+        CategoryDoesNotExistError
         """
-        to_delete = self.get(Path(path))
+        to_delete = self._descend(Path.of(path))
+        if not to_delete:
+            raise CategoryDoesNotExistError(path)
         if to_delete.is_root():
             raise RootDeleteError()
         to_delete.parent._remove_child(to_delete)
@@ -255,16 +440,24 @@ class Category:
 
         Raises:
         RootMoveError
+        CategoryDoesNotExistError
         """
-        path = Path(path)
-        new_parent_path = Path(new_parent_path)
+        path = Path.of(path)
+        new_parent_path = Path.of(new_parent_path)
 
-        category = self.get(path)
+        category = self._descend(path)
+        if not category:
+            raise CategoryDoesNotExistError(path)
         if category.is_root():
             raise RootMoveError()
 
-        new_parent = self.get(new_parent_path)
-        category.parent._remove_child(category)
+        new_parent = self._descend(new_parent_path)
+        if not new_parent:
+            raise CategoryDoesNotExistError(new_parent_path)
+        # Already there, the sibling check would otherwise reject the category against itself
+        if new_parent is category._parent:
+            return
+        # The category is detached from its current parent only once the new parent accepts it
         new_parent._add_child(category)
 
     def update(self, **data):
@@ -288,13 +481,16 @@ class Category:
         if 'name' in data:
             new_name = data.get('name')
 
-            if new_name in self.path:
-                raise DuplicateNameError(new_name, self.path)
+            # Check no ancestors with the same name
+            if new_name in self.ancestor_names:
+                raise DuplicateNameError(new_name, self)
 
-            if self.parent:
-                for child in self.parent.children:
-                    if new_name in child.name:
-                        raise DuplicateNameError(new_name, self.path)
+            # Check no siblings with the same name
+            parent = self._parent
+            if parent:
+                sibling = parent._children.get(new_name)
+                if sibling is not None and sibling is not self:
+                    raise DuplicateNameError(new_name, parent)
 
             self.name = new_name
 
@@ -315,21 +511,26 @@ class Category:
         if not path:
             category = self
         else:
-            category = self.get(Path(path))
+            category = self.get(path)
             if not category:
                 raise CategoryDoesNotExistError(path)
 
-        for child in category.children:
-            size = size + child.size()
+        # Count the children of each category at once, only categories with children are stacked
+        stack = [category]
+        while stack:
+            children = stack.pop()._children
+            size = size + len(children)
+            stack.extend(child for child in children.values() if child._children)
         return size
 
     def is_root(self):
         """
         Return True if the current category is the root one, False otherwise.
 
-        The category is root when its parent is None.
+        The category is root when its parent is None. See the root property for a category whose parent
+        was only assigned.
         """
-        return self.parent is None
+        return self._parent is None
 
     def is_leaf(self):
         """
@@ -337,19 +538,21 @@ class Category:
 
         The category is a leaf when it doesn't have children.
         """
-        return not self.children
+        return not self._children
 
     def is_sibling(self, other):
         """
         Return True if other is sibling to the current category, False otherwise
 
+        Two categories are siblings when they share the same parent, so roots have no siblings.
+
         Parameters:
         other(Category)
 
         Returns:
         (bool)
         """
-        return self.parent is other.parent and self is not other
+        return other is not self and self._parent is not None and other._parent is self._parent
 
     def get_by_depth(self, depth):
         """
@@ -357,28 +560,73 @@ class Category:
 
         Returning categories by depth from bottom up (i.e. negative depths) is not supported!
 
+        On the root, the categories are grouped by depth once and the groups are reused until the tree changes.
+
         Parameters:
         depth(int)
 
         Returns:
         categories(iterable of Category): categories found at the given depth
         """
-        categories = []
-
         if not isinstance(depth, int):
             raise InvalidDepthError('Depth must be an integer')
 
-        if depth == 0:
-            return [self]
-        elif depth == 1:
-            categories = self.children
-        else:
-            depth = depth - 1
-            for child in self.children:
-                categories.extend(child.get_by_depth(depth))
+        if depth < 0:
+            return []
+
+        if self.root is self:
+            by_depth = self._get_by_depth_index()
+            return list(by_depth[depth]) if depth < len(by_depth) else []
+
+        # Only the current level is kept while going down
+        categories = [self]
+        for _ in range(depth):
+            level = []
+            for category in categories:
+                level.extend(category._children.values())
+            categories = level
+            if not categories:
+                break
 
         return categories
 
+    def freeze(self):
+        """
+        Return a read-only snapshot of the tree under the current category.
+
+        The snapshot stores the tree in flat arrays, which makes repeated bulk queries
+        (size, leaves, get_by_depth) cheaper when the tree does not change anymore.
+
+        Returns:
+        (FrozenCategoryTree)
+        """
+        return FrozenCategoryTree(self)
+
+    def clone(self):
+        """
+        Return a copy of the tree under the current category.
+
+        The copy is detached, its root being the copy of the current category. Names, descriptions
+        and images are shared with the original. The original tree is already valid, so the copies
+        are wired together directly instead of being checked again on every add.
+
+        Returns:
+        (Category)
+        """
+        clone = Category(name=self._name, description=self.description, image=self.image)
+        stack = [(self, clone)]
+        while stack:
+            original, parent = stack.pop()
+            for child in original._children.values():
+                copy = Category(name=child._name, description=child.description, image=child.image)
+                copy._parent = parent
+                # Cached while the copy was still a root, the root and depth are resolved on first use
+                copy._ancestor_names = None
+                parent._children[copy._name] = copy
+                if child._children:
+                    stack.append((child, copy))
+        return clone
+
     def _add_child(self, child):
         """
         Add a child to the children of the current category.
@@ -397,16 +645,35 @@ class Category:
             raise NotACategoryError(child)
 
         # Check no ancestors with the same name
-        if child.name in self.path:
-            raise DuplicateNameError(child.name, self.path)
+        if child.name == self.name or child.name in self.ancestor_names:
+            raise DuplicateNameError(child.name, self)
 
         # Check no siblings with the same name
-        for ch in self.children:
-            if ch.name == child.name:
-                raise DuplicateNameError(child.name, child.path)
+        if child.name in self._children:
+            raise DuplicateNameError(child.name, self)
 
-        self.children.append(child)
+        self._attach(child)
+
+    def _attach(self, child):
+        """
+        Append an already validated child to the children and index it in the tree.
+
+        Parameters:
+        child(Category): child to be attached
+
+        Returns:
+        None
+        """
+        # A category can only have one parent
+        if child._parent is not None and child._parent is not self:
+            child._parent._remove_child(child)
+
+        self._children[child.name] = child
+        self._invalidate_leaves()
         child.parent = self
+        child._index(self.root)
+        child._tree_changed()
+        self.root._tree_changed()
 
     def _remove_child(self, child):
         """
@@ -418,9 +685,184 @@ class Category:
         Returns:
         None
         """
-        if child in self.children:
-            self.children.remove(child)
+        # Compare identities: another category with the same name is not a child
+        if self._children.get(child.name) is child:
+            del self._children[child.name]
+            self._invalidate_leaves()
+            child._unindex(self.root)
+            self.root._tree_changed()
             child.parent = None
+            # The detached category becomes the root of its own tree
+            child._name_index = None
+            child._tree_changed()
+
+    def _index(self, root, subtree=True):
+        """
+        Add the current category (and by default its descendants) to the name index of root.
+
+        Nothing needs to be done when the index of root has not been built yet.
+
+        Parameters:
+        root(Category): root of the tree the category belongs to
+        subtree(bool): whether the descendants should be indexed too
+
+        Returns:
+        None
+        """
+        # Only roots have an index, so the one of an attached subtree is not needed anymore
+        if self is not root:
+            self._name_index = None
+
+        index = root._name_index
+        if index is None:
+            return
+
+        stack = [self]
+        while stack:
+            category = stack.pop()
+            index.setdefault(category.name, []).append(category)
+            if subtree:
+                stack.extend(category._children.values())
+
+    def _unindex(self, root, subtree=True):
+        """
+        Remove the current category (and by default its descendants) from the name index of root.
+
+        Parameters:
+        root(Category): root of the tree the category belongs to
+        subtree(bool): whether the descendants should be removed too
+
+        Returns:
+        None
+        """
+        index = root._name_index
+        if index is None:
+            return
+
+        stack = [self]
+        while stack:
+            category = stack.pop()
+            # Several categories can share a name, so compare identities rather than names
+            categories = [c for c in index[category.name] if c is not category]
+            if categories:
+                index[category.name] = categories
+            else:
+                del index[category.name]
+            if subtree:
+                stack.extend(category._children.values())
+
+    def _get_name_index(self):
+        """
+        Return the name index of the tree whose root is the current category, building it on first use.
+
+        Returns:
+        index(dict): name -> list of categories with that name
+        """
+        if self._name_index is None:
+            self._name_index = {}
+            self._index(self)
+        return self._name_index
+
+    def _resolve_root(self):
+        """
+        Find the root and depth of the current category and of its ancestors that don't know them yet.
+
+        Walks up to the first ancestor whose root is known, or to the topmost category reachable through
+        the children of its ancestors, which is the root.
+
+        Returns:
+        None
+        """
+        unresolved = []
+        category = self
+        while category._root is None:
+            parent = category._parent
+            # A category whose parent was only assigned is not among its children, so it is a root
+            if parent is None or parent._children.get(category._name) is not category:
+                category._root = category
+                category._depth = 0
+                break
+            unresolved.append(category)
+            category = parent
+
+        root = category._root
+        depth = category._depth
+        for category in reversed(unresolved):
+            depth += 1
+            category._root = root
+            category._depth = depth
+
+    def _tree_changed(self):
+        """
+        Drop the caches of the root that depend on the structure of the tree (lookups, depth groups).
+
+        Returns:
+        None
+        """
+        self._get_cache = None
+        self._by_depth = None
+
+    def _get_by_depth_index(self):
+        """
+        Return the categories of the tree whose root is the current category, grouped by depth.
+
+        Built in a single level-order pass on first use, so every group is ordered from left to right.
+
+        Returns:
+        index(list of list of Category): categories at each depth, index 0 being the root
+        """
+        if self._by_depth is None:
+            self._by_depth = []
+            level = [self]
+            while level:
+                self._by_depth.append(level)
+                next_level = []
+                for category in level:
+                    next_level.extend(category._children.values())
+                level = next_level
+        return self._by_depth
+
+    def _invalidate_leaves(self):
+        """
+        Drop the cached leaves of the current category and all of its ancestors.
+
+        Every ancestor is visited: the leaves of an ancestor can be cached while the ones of
+        the current category are not, so stopping at the first empty cache would not be safe.
+
+        Returns:
+        None
+        """
+        category = self
+        while category is not None:
+            category._leaves_cache = None
+            category = category._parent
+
+    def _invalidate_path(self):
+        """
+        Clear the cached path, ancestor names, root and depth of the current category and all of its descendants.
+
+        Called whenever the category gets a new parent or a new name. These caches are only ever filled
+        from a category up to its ancestors, so a category without any of them has no descendant with
+        one either, and its subtree is skipped. Attaching a freshly built subtree is then O(1) instead
+        of a walk over the whole subtree.
+
+        Returns:
+        None
+        """
+        stack = [self]
+        while stack:
+            category = stack.pop()
+            if (
+                category._root is None
+                and category._path_cache is None
+                and category._ancestor_names is None
+            ):
+                continue
+            category._path_cache = None
+            category._ancestor_names = None
+            category._root = None
+            category._depth = None
+            stack.extend(category._children.values())
 
     def _add_parent(self, parent):
         """
@@ -437,11 +879,42 @@ class Category:
         None
         """
         grand_parent = self.parent
+        # Attaching the current category to the new parent detaches it from the grandparent
         parent._add_child(self)
         if grand_parent:
-            grand_parent.children.remove(self)
             grand_parent._add_child(parent)
 
+    def _descend(self, path):
+        """
+        Walk down the tree once to the category at the given path.
+
+        Parameters:
+        path(Path): path of the category that is searched for
+
+        Returns:
+        found(Category,None): the found category or None
+        """
+        is_root = self.root is self
+
+        if is_root and self._get_cache:
+            found = self._get_cache.get(path)
+            if found:
+                return found
+
+        start = self._find_start(path)
+        if not start:
+            return None
+
+        found = start._find(path)
+
+        # Only successful lookups are cached
+        if found and is_root:
+            if self._get_cache is None:
+                self._get_cache = {}
+            self._get_cache[path] = found
+
+        return found
+
     def _find_start(self, path):
         """
         Parameters:
@@ -451,16 +924,30 @@ class Category:
         found(Category,None): the found category or None
         """
         found = None
-
-        if self.name == path.root:
-            found = self
-        else:
-            for child in self.children:
-                found = child._find_start(path)
+        name = path.root
+
+        if self.root is self:
+            categories = self._get_name_index().get(name)
+            if not categories:
+                return None
+            # The name is unique in the tree, otherwise the first occurrence has to be searched for
+            if len(categories) == 1:
+                return categories[0]
+
+        # Stack of iterators over the children still to visit (pre-order, from left to right)
+        stack = [iter((self,))]
+        while stack and found is None:
+            for category in stack[-1]:
                 # Stop when first occurrence is found
                 # (even though there might be others somewhere)
-                if found:
+                if category._name == name:
+                    found = category
+                    break
+                if category._children:
+                    stack.append(iter(category._children.values()))
                     break
+            else:
+                stack.pop()
 
         return found
 
@@ -472,14 +959,29 @@ class Category:
         Returns:
         found(Category,None): the found category or None
         """
-        found = None
-        if self.name == path.root:
-            if len(path) == 1:
-                found = self
-            else:
-                for child in self.children:
-                    found = child._find(path[1:])
-                    if found:
-                        break
+        return self._find_from(path.nodes, 0)
+
+    def _find_from(self, nodes, i):
+        """
+        Find the category at nodes[i:], starting with the current category.
+
+        Walks the nodes by index with one dict lookup per level, so no intermediate Path or tuple
+        is built while descending.
+
+        Parameters:
+        nodes(tuple of str): nodes of the path that is searched for
+        i(int): index of the node that should match the current category
+
+        Returns:
+        found(Category,None): the found category or None
+        """
+        if self._name != nodes[i]:
+            return None
+
+        found = self
+        for j in range(i + 1, len(nodes)):
+            found = found._children.get(nodes[j])
+            if found is None:
+                break
         return found
 
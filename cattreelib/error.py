@@ -35,9 +35,18 @@ class ChildrenNotIterableError(CategoryTreeError):
 
 
 class DuplicateNameError(CategoryTreeError):
-    def __init__(self, name, path):
-        self.message = f"Name '{name}' already exist in branch '{path}'!"
-        super().__init__(self.message)
+    def __init__(self, name, category):
+        self.name = name
+        self.category = category
+        # CategoryTreeError.__init__ is skipped: the message is only formatted when it is needed
+        Exception.__init__(self, name, category)
+
+    @property
+    def message(self):
+        return f"Name '{self.name}' already exist in branch '{self.category.path}'!"
+
+    def __str__(self):
+        return self.message
 
 
 class RootDeleteError(CategoryTreeError):
@@ -0,0 +1,179 @@
+from array import array
+from cattreelib.path import Path
+from cattreelib.error import InvalidDepthError
+
+
+class FrozenCategoryTree:
+    """
+    Read-only snapshot of a category tree, flattened into parallel arrays.
+
+    The categories are numbered in depth-first (pre-order) order, so the root has index 0 and
+    the subtree of the category at index i occupies the indices i to ends[i] - 1.
+
+    For every index:
+        names: name of the category
+        parents: index of the parent (-1 for the root)
+        first_child: index of the first child (-1 for leaves)
+        next_sibling: index of the next sibling (-1 for the last child)
+        depths: depth of the category within the snapshot (0 for the root)
+        ends: index following the last category of the subtree
+
+    Queries (find, children, size, leaves, get_by_depth) run over these arrays with integer
+    indices instead of following references between Category objects. The snapshot does not
+    follow later changes of the tree.
+    """
+    NONE = -1
+
+    def __init__(self, category):
+        self.categories = []
+        self.names = []
+        self.parents = array('l')
+        self.first_child = array('l')
+        self.next_sibling = array('l')
+        self.depths = array('l')
+        self._index = {}
+
+        last_child = array('l')
+        stack = [(category, FrozenCategoryTree.NONE, 0)]
+        while stack:
+            category, parent, depth = stack.pop()
+            i = len(self.categories)
+
+            self.categories.append(category)
+            self.names.append(category.name)
+            self.parents.append(parent)
+            self.first_child.append(FrozenCategoryTree.NONE)
+            self.next_sibling.append(FrozenCategoryTree.NONE)
+            self.depths.append(depth)
+            last_child.append(FrozenCategoryTree.NONE)
+            # Keep the first occurrence, as Category.get does
+            self._index.setdefault(category.name, i)
+
+            if parent != FrozenCategoryTree.NONE:
+                if self.first_child[parent] == FrozenCategoryTree.NONE:
+                    self.first_child[parent] = i
+                else:
+                    self.next_sibling[last_child[parent]] = i
+                last_child[parent] = i
+
+            # Reversed so that the children are numbered from left to right
+            stack.extend((child, i, depth + 1) for child in reversed(category.children))
+
+        # Children have greater indices than their parent, so going backwards the ends of the
+        # children are known before the end of the parent is computed
+        self.ends = array('l', range(1, len(self.categories) + 1))
+        for i in reversed(range(len(self.categories))):
+            if last_child[i] != FrozenCategoryTree.NONE:
+                self.ends[i] = self.ends[last_child[i]]
+
+    def __len__(self):
+        return len(self.categories)
+
+    def __repr__(self):
+        return f"<FrozenCategoryTree: {self.names[0]}>"
+
+    def index(self, name):
+        """
+        Return the index of the first category (in depth-first order) with the given name.
+
+        Parameters:
+        name(str): name of the category
+
+        Returns:
+        index(int,None): index of the category or None
+        """
+        return self._index.get(name)
+
+    def find(self, path):
+        """
+        Return the index of the category at the given path, following the rules of Category.get.
+
+        The first node is looked up in the name index, the following ones are searched for among
+        the children by walking the first_child/next_sibling links.
+
+        Parameters:
+        path(str,iterable,Path): path of the category
+
+        Returns:
+        index(int,None): index of the category or None
+        """
+        nodes = iter(Path.of(path).nodes)
+        found = self._index.get(next(nodes))
+        if found is None:
+            return None
+
+        names = self.names
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+        for name in nodes:
+            child = first_child[found]
+            while child != FrozenCategoryTree.NONE and names[child] != name:
+                child = next_sibling[child]
+            if child == FrozenCategoryTree.NONE:
+                return None
+            found = child
+        return found
+
+    def children(self, index=0):
+        """
+        Return the indices of the children of the category at index.
+
+        Parameters:
+        index(int): index of the category, the root by default
+
+        Returns:
+        children(list of int): indices of the children from left to right
+        """
+        children = []
+        next_sibling = self.next_sibling
+        child = self.first_child[index]
+        while child != FrozenCategoryTree.NONE:
+            children.append(child)
+            child = next_sibling[child]
+        return children
+
+    def size(self, index=0):
+        """
+        Return the number of categories in the subtree of the category at index, including itself.
+
+        Parameters:
+        index(int): index of the category, the root by default
+
+        Returns:
+        size(int)
+        """
+        return self.ends[index] - index
+
+    def leaves(self, index=0):
+        """
+        Return the leaf categories of the subtree of the category at index.
+
+        Parameters:
+        index(int): index of the category, the root by default
+
+        Returns:
+        leaves(list of Category): leaves from left to right
+        """
+        first_child = self.first_child
+        categories = self.categories
+        return [
+            categories[i]
+            for i in range(index, self.ends[index])
+            if first_child[i] == FrozenCategoryTree.NONE
+        ]
+
+    def get_by_depth(self, depth):
+        """
+        Return all categories at a given depth within the snapshot.
+
+        Parameters:
+        depth(int)
+
+        Returns:
+        categories(list of Category): categories found at the given depth, from left to right
+        """
+        if not isinstance(depth, int):
+            raise InvalidDepthError('Depth must be an integer')
+
+        categories = self.categories
+        return [categories[i] for i, d in enumerate(self.depths) if d == depth]
@@ -1,4 +1,6 @@
+import sys
 from collections.abc import Iterable
+from functools import lru_cache
 from cattreelib.error import InvalidPathError
 
 
@@ -16,46 +18,142 @@ class Path:
     """
     SEPARATOR = '/'
 
+    __slots__ = ('_nodes', '_str', '_hash')
+
     def __init__(self, nodes):
         if isinstance(nodes, str):
-            nodes = nodes.split(Path.SEPARATOR)
-        elif isinstance(nodes, Iterable):
-            # list() is used so new object is created, instead of just reference to nodes
-            nodes = list(nodes)
+            self._set_nodes(Path._split(nodes), nodes)
         elif isinstance(nodes, Path):
-            # list() is used so new object is created, instead of just reference to nodes._nodes
-            nodes = list(nodes._nodes)
+            # Nodes of a Path are already validated (and immutable, so they can be shared)
+            self._nodes = nodes._nodes
+            self._str = nodes._str
+            self._hash = None
+        elif isinstance(nodes, Iterable):
+            self._set_nodes(Path._intern(Path._validate(tuple(nodes))))
         else:
             raise TypeError("Path must be str or iterable.")
 
-        # Make sure that no node is None or empty string
-        if not nodes:
+    @classmethod
+    def from_str(cls, string):
+        """
+        Create a path from a string of nodes separated by SEPARATOR.
+        """
+        return cls._unchecked(cls._split(string), string)
+
+    @classmethod
+    def from_iterable(cls, nodes):
+        """
+        Create a path from an iterable of nodes.
+        """
+        return cls._unchecked(cls._intern(cls._validate(tuple(nodes))))
+
+    @classmethod
+    def of(cls, nodes):
+        """
+        Return a path for nodes, reusing the parsed nodes of repeated strings.
+
+        The nodes of paths given as strings are kept in a bounded cache, which spares the parsing
+        when the same path is looked up again and again. Every call returns a new instance.
+        """
+        if isinstance(nodes, str):
+            return cls._unchecked(_split_cached(nodes), nodes)
+        return cls(nodes)
+
+    @classmethod
+    def _unchecked(cls, nodes, string=None):
+        """
+        Create a path from a tuple of nodes that are already known to be valid.
+
+        Used internally to skip the validation of nodes coming from other paths or categories.
+        """
+        path = cls.__new__(cls)
+        path._set_nodes(nodes, string)
+        return path
+
+    def _set_nodes(self, nodes, string=None):
+        """
+        Set the nodes along with the string derived from them.
+
+        The string is joined from the nodes unless the caller already has it. The hash is computed
+        on first use, see __hash__().
+        """
+        if string is None:
+            string = Path.SEPARATOR.join(nodes)
+        self._nodes = nodes
+        self._str = string
+        self._hash = None
+
+    @staticmethod
+    def _split(string):
+        """
+        Return the nodes of a string path, raise InvalidPathError if any of them is empty.
+
+        The nodes of a split string are always strings, so only empty nodes (leading, trailing or
+        doubled separators) have to be looked for, which a single membership test does.
+        """
+        nodes = tuple(map(sys.intern, string.split(Path.SEPARATOR)))
+        if '' in nodes:
+            raise InvalidPathError(nodes)
+        return nodes
+
+    @staticmethod
+    def _intern(nodes):
+        """
+        Return validated nodes interned, so comparing them to interned category names is
+        an identity check and dict lookups by node hit the fast path.
+        """
+        return tuple(map(sys.intern, nodes))
+
+    @staticmethod
+    def _validate(nodes):
+        """
+        Return nodes if they form a valid path, raise InvalidPathError otherwise.
+        """
+        # Make sure that every node is a non-empty string (exactly str, so that it can be interned)
+        if not nodes or not all(type(node) is str and node for node in nodes):
             raise InvalidPathError(nodes)
 
-        for node in nodes:
-            if not node or not isinstance(node, str):
-                raise InvalidPathError(nodes)
-
-        self._nodes = nodes
+        return nodes
 
     def __str__(self):
-        return Path.SEPARATOR.join(self._nodes)
+        return self._str
 
     def __repr__(self):
         return f"<Path: {self}>"
 
-    def __getitem__(self, *args):
-        return Path(self._nodes.__getitem__(*args))
+    def __getitem__(self, key):
+        nodes = self._nodes[key]
+        if not isinstance(key, slice):
+            return Path._unchecked((nodes,))
+        if not nodes:
+            raise InvalidPathError(nodes)
+        return Path._unchecked(nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __contains__(self, node):
+        return node in self._nodes
 
     def __len__(self):
         return len(self._nodes)
 
     def __eq__(self, other):
+        if isinstance(other, Path):
+            return self._nodes == other._nodes
+        if isinstance(other, str):
+            return self._str == other
         return self._nodes == Path(other)._nodes
 
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._str)
+        return self._hash
+
     def __add__(self, other):
-        self._nodes += Path(other).nodes
-        return self
+        if not isinstance(other, Path):
+            other = Path(other)
+        return Path._unchecked(self._nodes + other._nodes, self._str + Path.SEPARATOR + other._str)
 
     @property
     def nodes(self):
@@ -66,4 +164,19 @@ class Path:
         return self._nodes[0]
 
     def add(self, node):
-        self._nodes.append(node)
+        """
+        Append a node to the path, in place.
+
+        A path that has already been hashed may be a dict key or a set member, so it can't be changed.
+
+        Raises:
+        TypeError
+        """
+        if self._hash is not None:
+            raise TypeError("A path can't be changed once it has been hashed.")
+        self._set_nodes(self._nodes + (node,), self._str + Path.SEPARATOR + node)
+
+
+@lru_cache(maxsize=1024)
+def _split_cached(string):
+    return Path._split(string)
@@ -3,8 +3,8 @@ import pytest
 from cattreelib import Category
 
 
-@pytest.fixture
-def tree():
+@pytest.fixture(scope='module')
+def tree_template():
     return Category(
         name='food',
         children=[
@@ -63,19 +63,32 @@ def tree():
     )
 
 
+@pytest.fixture(scope='module')
+def animal_template():
+    return Category(
+        name='animal',
+        children=[
+            Category(
+                name='mammal',
+                children=[
+                    Category(name='dog'),
+                    Category(
+                        name='cat',
+                        children=[
+                            Category(name='lion'),
+                        ]
+                    ),
+                ]
+            ),
+        ]
+    )
+
+
 @pytest.fixture
-def animal():
-    animal = Category(name='animal')
-    mammal = Category(name='mammal')
-    cat = Category(name='cat')
-    dog = Category(name='dog')
-    lion = Category(name='lion')
-    animal._children = [mammal]
-    mammal._parent = animal
-    mammal._children = [dog, cat]
-    dog._parent = mammal
-    cat._parent = mammal
-    cat._children = [lion]
-    lion._parent = cat
+def tree(tree_template):
+    return tree_template.clone()
 
-    return animal
+
+@pytest.fixture
+def animal(animal_template):
+    return animal_template.clone()
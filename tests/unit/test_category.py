@@ -1,5 +1,6 @@
+import sys
 import pytest
-from tests.fixtures import tree, animal
+from tests.fixtures import tree, tree_template, animal, animal_template
 
 from cattreelib.category import Category
 from cattreelib.path import Path
@@ -13,6 +14,7 @@ from cattreelib.error import (
     DuplicateNameError,
     CategoryDoesNotExistError,
     InvalidDepthError,
+    InvalidPathError,
 )
 
 
@@ -30,6 +32,37 @@ def test_path_property():
     assert animal.path == 'animal'
 
 
+def test_path_cache(animal):
+    lion = animal.get('lion')
+    cat = animal.get('cat')
+
+    # changing a returned path doesn't change the cached ones (lion's is built from cat's)
+    cat.path.add('tiger')
+    assert cat.path == 'animal/mammal/cat'
+    assert lion.path == 'animal/mammal/cat/lion'
+
+    animal.move('lion', 'dog')
+    assert lion.path == 'animal/mammal/dog/lion'
+
+    animal.get('dog').update(name='dogs')
+    assert lion.path == 'animal/mammal/dogs/lion'
+
+    animal.delete('dogs')
+    assert lion.path == 'dogs/lion'
+
+
+def test_ancestor_names(animal):
+    lion = animal.get('lion')
+    assert animal.ancestor_names == frozenset()
+    assert lion.ancestor_names == {'animal', 'mammal', 'cat'}
+
+    animal.move('lion', 'dog')
+    assert lion.ancestor_names == {'animal', 'mammal', 'dog'}
+
+    animal.get('mammal').update(name='mammals')
+    assert lion.ancestor_names == {'animal', 'mammals', 'dog'}
+
+
 def test_get_parent():
     animal = Category(name='animal')
     cat = Category(name='cat')
@@ -67,7 +100,7 @@ def test_get_children():
     cat = Category(name='cat')
     dog = Category(name='dog')
 
-    animal._children = [cat, dog]
+    animal._children = {'cat': cat, 'dog': dog}
     assert animal.children == [cat, dog]
 
 
@@ -77,13 +110,13 @@ def test_set_children():
     dog = Category(name='dog')
 
     animal.children = []
-    assert animal._children == []
+    assert animal.children == []
 
     animal.children = [cat]
-    assert animal._children == [cat]
+    assert animal.children == [cat]
 
     animal.children = [cat, dog]
-    assert animal._children == [cat, dog]
+    assert animal.children == [cat, dog]
 
     with pytest.raises(ChildrenNotIterableError):
         animal.children = cat
@@ -97,6 +130,18 @@ def test_set_children():
     with pytest.raises(NotACategoryError):
         animal.children = [7]
 
+    # sibling with same name
+    with pytest.raises(DuplicateNameError):
+        animal.children = [Category(name='bird'), Category(name='bird')]
+
+    # ancestor with same name
+    with pytest.raises(DuplicateNameError):
+        animal.children = [Category(name='animal')]
+
+    # children are left untouched when the new ones are invalid
+    assert animal.children == [cat, dog]
+    assert cat.parent is animal
+
 
 def test_get(tree):
     found = tree.get('food')
@@ -144,32 +189,57 @@ def test_get(tree):
     found = tree.get('cars')
     assert found is None
 
+    with pytest.raises(InvalidPathError):
+        tree.get('')
+
+def test_get_cache(tree):
+    apple = tree.get('fruits/apple')
+    assert tree._get_cache == {Path('fruits/apple'): apple}
+    assert apple._get_cache is None
+    assert tree.get('fruits/apple') is apple
+
+    tree.get('fruits/cherry')
+    assert Path('fruits/cherry') not in tree._get_cache
+
+    tree.move('apple', 'vegetables')
+    assert tree._get_cache is None
+    assert tree.get('fruits/apple') is None
+    assert tree.get('vegetables/apple') is apple
+
+    apple.update(name='apples')
+    assert tree._get_cache is None
+    assert tree.get('vegetables/apple') is None
+
+
 def test_add(animal):
     bird = Category(name='bird')
     animal.add(bird)
-    assert bird in animal._children
+    assert bird in animal.children
 
     wild_dog = Category(name='wild_dog')
     animal.add(wild_dog, 'dog')
-    assert wild_dog in animal.get('dog')._children
+    assert wild_dog in animal.get('dog').children
 
     tiger = Category(name='tiger')
     animal.add(tiger, 'cat')
-    assert tiger in animal.get('cat')._children
+    assert tiger in animal.get('cat').children
 
     white_lion = Category(name='white_lion')
     animal.add(white_lion, 'cat/lion')
-    assert white_lion in animal.get('cat/lion')._children
+    assert white_lion in animal.get('cat/lion').children
 
 
 def test_delete_root(animal):
     with pytest.raises(RootDeleteError):
         animal.delete('animal')
 
+    with pytest.raises(CategoryDoesNotExistError):
+        animal.delete('bird')
+
 
 def test_delete_1_node_path(animal):
     animal.delete('mammal')
-    assert animal._children == []
+    assert animal.children == []
 
 def test_delete_2_nodes_path(animal):
     mammal = animal.get('mammal')
@@ -177,7 +247,7 @@ def test_delete_2_nodes_path(animal):
 
     animal.delete('mammal/cat')
 
-    assert cat not in mammal._children
+    assert cat not in mammal.children
     assert cat._parent is None
 
 
@@ -187,7 +257,7 @@ def test_delete_3_nodes_path(animal):
 
     animal.delete('mammal/cat/lion')
 
-    assert lion not in cat._children
+    assert lion not in cat.children
     assert lion._parent is None
 
 
@@ -197,7 +267,7 @@ def test_delete_from_the_middle(animal):
 
     animal.delete('cat/lion')
 
-    assert lion not in cat._children
+    assert lion not in cat.children
     assert lion._parent is None
 
 
@@ -207,7 +277,7 @@ def test_delete_leaf(animal):
 
     animal.delete('lion')
 
-    assert lion not in cat._children
+    assert lion not in cat.children
     assert lion._parent is None
 
 
@@ -226,12 +296,70 @@ def test_move(animal):
     assert lion in dog.children
     assert lion not in cat.children
 
+    # a move rejected by the new parent leaves the category in place
+    dog.add(Category(name='tiger'))
+    tiger = Category(name='tiger')
+    cat.add(tiger)
+    with pytest.raises(DuplicateNameError):
+        animal.move('cat/tiger', 'dog')
+    assert tiger._parent is cat
+    assert tiger in cat.children
+
+    # moving a category under its current parent changes nothing
+    mammal = animal.get('mammal')
+    animal.move('cat', 'mammal')
+    assert cat._parent is mammal
+    assert mammal.children == [dog, cat]
+
+    with pytest.raises(CategoryDoesNotExistError):
+        animal.move('bird', 'dog')
+
+    with pytest.raises(CategoryDoesNotExistError):
+        animal.move('lion', 'bird')
+
 
 def test_update(animal):
     cat = animal.get('cat')
     cat.update(name='cats', description='some description')
     assert cat.name == 'cats'
     assert cat.description == 'some description'
+    assert [c.name for c in animal.get('mammal').children] == ['dog', 'cats']
+
+    # names contained in a sibling's name are not duplicates
+    cat.update(name='do')
+    assert cat.name == 'do'
+
+    cat.update(name='do')
+    assert cat.name == 'do'
+
+
+def test_set_name(animal):
+    cat = animal.get('cat')
+    cat.name = 'cats'
+    assert animal.get('cats') is cat
+    assert animal.get('mammal/cats/lion').name == 'lion'
+    assert animal.get('cat') is None
+    assert [c.name for c in animal.get('mammal').children] == ['dog', 'cats']
+
+    # the parent doesn't know about a category whose parent was only assigned
+    bird = Category(name='bird', parent=animal)
+    bird.name = 'birds'
+    assert animal.get('birds') is None
+    assert bird.path == 'animal/birds'
+
+
+def test_set_name_same_name_sibling(animal):
+    cat = animal.get('cat')
+    dog = animal.get('dog')
+    mammal = animal.get('mammal')
+    with pytest.raises(DuplicateNameError):
+        cat.name = 'dog'
+
+    assert cat.name == 'cat'
+    assert mammal.children == [dog, cat]
+    assert animal.get('cat') is cat
+    assert animal.get('dog') is dog
+    assert animal.size() == 5
 
 
 def test_update_same_name_parent(animal):
@@ -254,6 +382,28 @@ def test_leaves(tree):
     assert fruit_leaves == [apple_red, apple_green, apple_yellow]
 
 
+def test_leaves_cache(tree):
+    apple = tree.get('apple')
+    tree_leaves = tree.leaves
+    assert tree.leaves == tree_leaves
+    assert apple.leaves == apple.children
+
+    # The cached list is not exposed
+    tree.leaves.clear()
+    assert tree.leaves == tree_leaves
+
+    yellow = apple.get('yellow')
+    golden = Category(name='golden')
+    yellow.add(golden)
+    assert golden in tree.leaves
+    assert all(leaf is not yellow for leaf in tree.leaves)
+    assert apple.leaves == [apple.get('red'), apple.get('green'), golden]
+
+    tree.delete('fruits')
+    assert golden not in tree.leaves
+    assert tree.leaves == tree.get('vegetables').leaves
+
+
 def test_size(tree):
     assert tree.size() == 24
     assert tree.size('food') == 24
@@ -284,6 +434,50 @@ def test_is_root():
     assert big_cat.is_root() is False
 
 
+def test_root(animal):
+    lion = animal.get('lion')
+    cat = animal.get('cat')
+    assert lion.root is animal
+    assert animal.root is animal
+    assert lion.root is animal
+
+    # resolved again on first use after the category is detached
+    animal.delete('cat')
+    assert lion._root is None
+    assert cat.root is cat
+    assert lion.root is cat
+    assert cat.is_root() is True
+
+    # an assigned parent does not make the category part of its tree
+    creature = Category(name='creature')
+    cat.parent = creature
+    assert cat.root is cat
+    assert lion.root is cat
+    assert cat.is_root() is False
+
+    creature.add(cat)
+    assert cat.root is creature
+    assert lion.root is creature
+
+
+def test_assigned_parent(animal):
+    lion = animal.get('lion')
+    wolf = Category(name='wolf', parent=animal)
+    pup = Category(name='pup')
+    wolf.add(pup)
+
+    # not reachable from the root until the category is added to the children of its parent
+    assert pup.root is wolf
+    assert animal.get('pup') is None
+
+    animal.add(wolf)
+    assert pup.root is animal
+    assert animal.get('pup') is pup
+    assert animal.get('wolf/pup') is pup
+    assert animal._get_name_index()['pup'] == [pup]
+    assert animal.get('lion') is lion
+
+
 def test_is_sibling(animal):
     dog = animal.get('dog')
     cat = animal.get('cat')
@@ -292,6 +486,9 @@ def test_is_sibling(animal):
     assert cat.is_sibling(dog) is True
     assert cat.is_sibling(lion) is False
 
+    # roots don't share a parent
+    assert animal.is_sibling(Category(name='plant')) is False
+
 
 def test_get_by_depth(tree):
     categories_depth_0 = tree.get_by_depth(0)
@@ -312,6 +509,9 @@ def test_get_by_depth(tree):
         tree.get('tomato')
     ]
 
+    assert tree.get_by_depth(4) == []
+    assert tree.get_by_depth(-1) == []
+
     with pytest.raises(InvalidDepthError):
         tree.get_by_depth('1')
 
@@ -319,6 +519,105 @@ def test_get_by_depth(tree):
         tree.get_by_depth(None)
 
 
+def test_deep_tree():
+    # Deeper than the recursion limit: traversals must not recurse
+    depth = sys.getrecursionlimit() + 100
+    root = category = Category(name='0')
+    for i in range(1, depth):
+        child = Category(name=str(i))
+        category.add(child)
+        category = child
+
+    assert root.size() == depth
+    assert root.leaves == [category]
+    assert root.get_by_depth(depth - 1) == [category]
+    assert len(category.path) == depth
+    assert root.get(str(depth - 1)) is category
+
+    root.delete('1')
+    assert root.size() == 1
+    assert category.root.name == '1'
+
+
+def test_resolve_root():
+    # Built bottom up: attaching a subtree doesn't visit the categories below it
+    depth = sys.getrecursionlimit() + 100
+    leaf = category = Category(name='0')
+    for i in range(1, depth):
+        category = Category(name=str(i), children=[category])
+
+    assert leaf._root is None
+    assert leaf.root is category
+    assert leaf.depth == depth - 1
+    assert leaf.get_by_depth(0) == [leaf]
+
+    middle = category.get(str(depth // 2))
+    assert middle._root is category
+    assert middle.depth == depth - 1 - depth // 2
+
+    # Cached roots and depths are cleared below a detached category
+    category.delete(str(depth // 2))
+    assert leaf._root is None
+    assert leaf.root is middle
+    assert leaf.depth == depth // 2
+
+
+def test_get_by_depth_index(tree):
+    apple = tree.get('apple')
+    assert tree._by_depth is None
+    assert tree.get_by_depth(3) == apple.children + tree.get('grape').children + tree.get('pear').children + \
+        tree.get('pepper').children + tree.get('tomato').children
+    assert len(tree._by_depth) == 4
+
+    # from a category which is not the root
+    assert tree.get('fruits').get_by_depth(1) == [apple, tree.get('grape'), tree.get('pear')]
+
+    tree.move('apple', 'carrot')
+    assert tree._by_depth is None
+    assert apple in tree.get_by_depth(3)
+    assert apple.children[0] in tree.get_by_depth(4)
+
+
+def test_depth(tree):
+    apple = tree.get('apple')
+    assert tree.depth == 0
+    assert apple.depth == 2
+    assert apple.children[0].depth == 3
+
+    tree.move('apple', 'carrot')
+    assert apple.depth == 3
+    assert apple.children[0].depth == 4
+
+    tree.delete('apple')
+    assert apple.depth == 0
+    assert apple.children[0].depth == 1
+
+
+def test_clone(tree):
+    apple = tree.get('apple')
+    apple.description = 'Malus domestica'
+
+    clone = tree.clone()
+    assert clone is not tree
+    assert clone.is_root()
+    assert [c.path for c in clone.leaves] == [c.path for c in tree.leaves]
+    assert clone.size() == tree.size()
+    assert clone.get('apple') is not apple
+    assert clone.get('apple').description == 'Malus domestica'
+    assert clone.get('apple').root is clone
+    assert clone.get('apple/red').depth == 3
+
+    apple_clone = apple.clone()
+    assert apple_clone.is_root()
+    assert apple_clone.path == Path('apple')
+    assert apple_clone.children == apple.children
+
+    # The copy does not follow the original
+    clone.delete('fruits')
+    assert tree.get('apple') is apple
+    assert clone.get('apple') is None
+
+
 def test_add_child():
     animal = Category(name='animal')
     cat = Category(name='cat')
@@ -328,9 +627,10 @@ def test_add_child():
     assert cat.parent is animal
 
     # sibling with same name
-    with pytest.raises(DuplicateNameError):
+    with pytest.raises(DuplicateNameError) as error:
         another_cat = Category(name='cat')
         animal._add_child(another_cat)
+    assert str(error.value) == "Name 'cat' already exist in branch 'animal'!"
 
     # ancestor with same name
     with pytest.raises(DuplicateNameError):
@@ -348,17 +648,19 @@ def test_add_child():
 
 
 def test_remove_child():
-    animal = Category(name='animal')
     cat = Category(name='cat')
-    cat._parent = animal
     dog = Category(name='dog')
-    dog._parent = animal
-    animal._children = [cat, dog]
+    animal = Category(name='animal', children=[cat, dog])
 
     animal._remove_child(cat)
-    assert animal._children == [dog]
+    assert animal.children == [dog]
     assert cat.parent is None
 
+    # a category with the same name is not a child
+    animal._remove_child(Category(name='dog'))
+    assert animal.children == [dog]
+    assert dog.parent is animal
+
 
 def test_add_parent():
     # add on top of root
@@ -370,10 +672,8 @@ def test_add_parent():
     assert animal.children == [cat]
 
     # add instead of previous parent
-    animal = Category(name='animal')
     lion = Category(name='lion')
-    animal._children = [lion]
-    lion._parent = animal
+    animal = Category(name='animal', children=[lion])
 
     cat = Category(name='cat')
     lion._add_parent(cat)
@@ -382,6 +682,13 @@ def test_add_parent():
     assert cat.children == [lion]
     assert animal.children == [cat]
 
+    # a rejected parent leaves the category where it was
+    with pytest.raises(DuplicateNameError):
+        lion._add_parent(Category(name='lion'))
+
+    assert lion.parent is cat
+    assert cat.children == [lion]
+
 
 def test_find_start(tree):
     found = tree._find_start(Path('food'))
@@ -431,6 +738,36 @@ def test_find_start(tree):
     assert found is None
 
 
+def test_name_index(tree):
+    # built on first lookup
+    assert tree._name_index is None
+    carrot = tree.get('carrot')
+    vegetables = tree.get('vegetables')
+    assert tree._name_index['carrot'] == [carrot]
+    assert len(tree._name_index['red']) == 3
+    assert carrot.root is tree
+    assert carrot._name_index is None
+
+    tree.delete('vegetables')
+    assert 'carrot' not in tree._name_index
+    assert len(tree._name_index['red']) == 1
+    assert tree.get('carrot') is None
+    assert vegetables._name_index is None
+    assert vegetables.get('carrot') is carrot
+    assert len(vegetables._name_index['red']) == 2
+    assert carrot.root is vegetables
+
+    carrot.update(name='carrots')
+    assert 'carrot' not in vegetables._name_index
+    assert vegetables.get('carrots') is carrot
+    assert vegetables.get('vegetables/carrots') is carrot
+
+    tree.add(vegetables)
+    assert vegetables._name_index is None
+    assert tree.get('carrots') is carrot
+    assert tree.get('food/vegetables/carrots') is carrot
+
+
 def test_find(tree):
     found = tree._find(Path('food/fruits'))
     assert isinstance(found, Category)
@@ -458,3 +795,18 @@ def test_find(tree):
 
     found = tree._find(Path('carrot'))
     assert found is None
+
+
+def test_find_from(tree):
+    nodes = ('food', 'fruits', 'apple', 'red')
+    assert tree._find_from(nodes, 0) is tree.get('food/fruits/apple/red')
+    assert tree.get('apple')._find_from(nodes, 2) is tree.get('apple/red')
+    assert tree.get('apple')._find_from(nodes, 3) is None
+    assert tree._find_from(('food', 'apple'), 0) is None
+
+
+def test_interned_names(tree):
+    name = ''.join(['app', 'le'])
+    assert tree.get('apple').name is sys.intern(name)
+    assert Path(['fruits', name]).nodes[1] is tree.get('apple').name
+    assert Path('fruits/' + name).nodes[1] is tree.get('apple').name
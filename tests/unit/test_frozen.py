@@ -0,0 +1,76 @@
+import pytest
+from tests.fixtures import tree, tree_template
+
+from cattreelib.frozen import FrozenCategoryTree
+from cattreelib.error import InvalidDepthError
+
+
+def test_freeze(tree):
+    frozen = tree.freeze()
+    assert isinstance(frozen, FrozenCategoryTree)
+    assert len(frozen) == 24
+    assert frozen.categories[0] is tree
+    assert frozen.names[:5] == ['food', 'fruits', 'apple', 'red', 'green']
+
+
+def test_links(tree):
+    frozen = tree.freeze()
+    fruits = frozen.index('fruits')
+    apple = frozen.index('apple')
+    grape = frozen.index('grape')
+
+    assert frozen.parents[0] == -1
+    assert frozen.parents[apple] == fruits
+    assert frozen.first_child[fruits] == apple
+    assert frozen.next_sibling[apple] == grape
+    assert frozen.first_child[frozen.index('carrot')] == -1
+    assert frozen.next_sibling[frozen.index('vegetables')] == -1
+
+
+def test_index(tree):
+    frozen = tree.freeze()
+    assert frozen.index('food') == 0
+    assert frozen.categories[frozen.index('red')] is tree.get('apple/red')
+    assert frozen.index('cars') is None
+
+
+def test_find(tree):
+    frozen = tree.freeze()
+    assert frozen.find('food') == 0
+    for path in ['food/fruits/apple', 'apple/red', 'vegetables/pepper/yellow', 'carrot', 'tomato/green']:
+        assert frozen.categories[frozen.find(path)] is tree.get(path)
+    assert frozen.find(['fruits', 'pear', 'asian']) == frozen.index('asian')
+    assert frozen.find('food/apple') is None
+    assert frozen.find('carrot/red') is None
+    assert frozen.find('cars') is None
+
+
+def test_children(tree):
+    frozen = tree.freeze()
+    assert [frozen.names[i] for i in frozen.children()] == ['fruits', 'vegetables']
+    apple = frozen.index('apple')
+    assert [frozen.categories[i] for i in frozen.children(apple)] == tree.get('apple').children
+    assert frozen.children(frozen.index('carrot')) == []
+
+
+def test_size(tree):
+    frozen = tree.freeze()
+    assert frozen.size() == tree.size()
+    assert frozen.size(frozen.index('apple')) == tree.size('apple')
+    assert frozen.size(frozen.index('vegetables')) == tree.size('vegetables')
+    assert frozen.size(frozen.index('carrot')) == 1
+
+
+def test_leaves(tree):
+    frozen = tree.freeze()
+    assert frozen.leaves() == tree.leaves
+    assert frozen.leaves(frozen.index('apple')) == tree.get('apple').leaves
+
+
+def test_get_by_depth(tree):
+    frozen = tree.freeze()
+    for depth in range(5):
+        assert frozen.get_by_depth(depth) == tree.get_by_depth(depth)
+
+    with pytest.raises(InvalidDepthError):
+        frozen.get_by_depth('1')
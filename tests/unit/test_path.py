@@ -5,26 +5,62 @@ from cattreelib.error import InvalidPathError
 
 def test_init_from_str():
     path = Path('food')
-    assert path._nodes == ['food']
+    assert path._nodes == ('food',)
 
     path = Path('food/fruits')
-    assert path._nodes == ['food', 'fruits']
+    assert path._nodes == ('food', 'fruits')
 
     path = Path('food/fruits/apple')
-    assert path._nodes == ['food', 'fruits', 'apple']
+    assert path._nodes == ('food', 'fruits', 'apple')
 
 
 def test_init_from_iterable():
     path = Path(['food', 'fruits', 'apple'])
-    assert path._nodes == ['food', 'fruits', 'apple']
+    assert path._nodes == ('food', 'fruits', 'apple')
 
     path = Path(('food', 'fruits', 'apple'))
-    assert path._nodes == ['food', 'fruits', 'apple']
+    assert path._nodes == ('food', 'fruits', 'apple')
 
 
 def test_init_from_path():
     path = Path(Path('food'))
-    assert path._nodes == ['food']
+    assert path._nodes == ('food',)
+
+
+def test_from_str():
+    path = Path.from_str('food/fruits/apple')
+    assert isinstance(path, Path)
+    assert path._nodes == ('food', 'fruits', 'apple')
+
+    with pytest.raises(InvalidPathError):
+        Path.from_str('food//apple')
+
+
+def test_from_iterable():
+    path = Path.from_iterable(('food', 'fruits', 'apple'))
+    assert isinstance(path, Path)
+    assert path._nodes == ('food', 'fruits', 'apple')
+
+    with pytest.raises(InvalidPathError):
+        Path.from_iterable(['food', 7])
+
+
+def test_of():
+    path = Path.of('food/fruits/apple')
+    assert path == Path('food/fruits/apple')
+    assert Path.of('food/fruits/apple').nodes is path.nodes
+    assert Path.of('food/fruits/apple') is not path
+    assert Path.of(['food', 'fruits']) == Path('food/fruits')
+    assert Path.of(path) is not path
+
+    with pytest.raises(InvalidPathError):
+        Path.of('food//apple')
+
+    # changing a returned path doesn't affect the next ones
+    path.add('red')
+    assert path == 'food/fruits/apple/red'
+    assert Path.of('food/fruits/apple') == 'food/fruits/apple'
+    assert hash(Path.of('food/fruits/apple')) == hash(Path('food/fruits/apple'))
 
 
 def test_invalid_path():
@@ -57,6 +93,7 @@ def test_str():
     assert str(Path('food')) == 'food'
     assert str(Path(['food'])) == 'food'
     assert str(Path(['food', 'fruits'])) == 'food/fruits'
+    assert str(Path('food') + ['fruits', 'apple']) == 'food/fruits/apple'
 
 
 def test_equal():
@@ -77,8 +114,33 @@ def test_equal():
     assert Path('food/fruits') == ['food', 'fruits']
 
 
+def test_hash():
+    assert hash(Path('food/fruits')) == hash(Path(['food', 'fruits']))
+    cache = {Path('food/fruits'): 'fruits'}
+    assert cache[Path(['food', 'fruits'])] == 'fruits'
+
+
 def test_getitem():
-    pass
+    path = Path('food/fruits/apple')
+    assert path[0] == Path('food')
+    assert path[-1] == Path('apple')
+    assert path[1:] == Path('fruits/apple')
+    assert isinstance(path[1:], Path)
+
+    with pytest.raises(InvalidPathError):
+        path[3:]
+
+
+def test_iter():
+    assert list(Path('food/fruits/apple')) == ['food', 'fruits', 'apple']
+    assert all(isinstance(node, str) for node in Path('food/fruits'))
+
+
+def test_contains():
+    assert 'fruits' in Path('food/fruits/apple')
+    assert 'apple' in Path('food/fruits/apple')
+    assert 'fruit' not in Path('food/fruits/apple')
+    assert 'pepper' not in Path('food/fruits/apple')
 
 
 def test_len():
@@ -87,37 +149,47 @@ def test_len():
     assert len(Path('food/fruits/apple')) == 3
 
 
-def test_add():
+def test_concat():
     # add Path
     path = Path('food')
     path = path + Path('fruits')
-    assert path._nodes == ['food', 'fruits']
+    assert path._nodes == ('food', 'fruits')
 
     # add string (single)
     path = Path('food')
     path = path + 'fruits'
-    assert path._nodes == ['food', 'fruits']
+    assert path._nodes == ('food', 'fruits')
 
     # add string (multiple)
     path = Path('food')
     path = path + 'fruits/apple'
-    assert path._nodes == ['food', 'fruits', 'apple']
+    assert path._nodes == ('food', 'fruits', 'apple')
 
     # add iterable (single)
     path = Path('food')
     path = path + ['fruits']
-    assert path._nodes == ['food', 'fruits', 'apple']
+    assert path._nodes == ('food', 'fruits')
 
     # add iterable (multiple)
     path = Path('food')
     path = path + ['fruits', 'apple']
-    assert path._nodes == ['food', 'fruits', 'apple']
+    assert path._nodes == ('food', 'fruits', 'apple')
+
+    # operands are left unchanged
+    path = Path('food')
+    other = Path('fruits')
+    assert path + other == 'food/fruits'
+    assert path._nodes == ('food',)
+    assert other._nodes == ('fruits',)
+
+    with pytest.raises(InvalidPathError):
+        Path('food') + 'fruits/'
 
 
 def test_nodes():
-    assert Path('food').nodes == ['food']
-    assert Path('food/fruits/apple').nodes == ['food', 'fruits', 'apple']
-    assert Path('apple/red').nodes == ['apple', 'red']
+    assert Path('food').nodes == ('food',)
+    assert Path('food/fruits/apple').nodes == ('food', 'fruits', 'apple')
+    assert Path('apple/red').nodes == ('apple', 'red')
 
 
 def test_root():
@@ -129,7 +201,20 @@ def test_root():
 def test_add():
     path = Path('food')
     path.add('fruits')
-    assert path._nodes == ['food', 'fruits']
+    assert path._nodes == ('food', 'fruits')
 
     path.add('apple')
-    assert path._nodes == ['food', 'fruits', 'apple']
+    assert path._nodes == ('food', 'fruits', 'apple')
+    assert str(path) == 'food/fruits/apple'
+    assert hash(path) == hash(Path('food/fruits/apple'))
+
+    # a hashed path may be a dict key, so it can't be changed anymore
+    cache = {path: 'apple'}
+    with pytest.raises(TypeError):
+        path.add('red')
+    assert cache[Path('food/fruits/apple')] == 'apple'
+
+    # a copy can be changed
+    copy = Path(path)
+    copy.add('red')
+    assert copy == 'food/fruits/apple/red'